@@ -11,8 +11,9 @@ from __future__ import annotations
 
 import math
 import random
-from dataclasses import dataclass
-from typing import Tuple
+import time
+from dataclasses import dataclass, field
+from typing import Sequence, Tuple
 
 import pygame
 
@@ -20,6 +21,9 @@ import pygame
 # Screen and gameplay constants
 WIDTH, HEIGHT = 800, 1000
 FPS = 60
+PHYS_DT = 1 / 120  # fixed physics step, decoupled from the render rate
+MAX_FRAME_TIME = 0.25  # cap on simulated time per frame after a stall
+PHYS_SUBSTEPS = 4  # ball sub-steps per physics step, keeps fast balls from tunnelling
 GRAVITY = 900  # pixels per second squared
 BALL_RADIUS = 12
 FLIPPER_LENGTH = 110
@@ -30,6 +34,13 @@ FLIPPER_SPEED = math.radians(400)
 BUMPER_RADIUS = 28
 BUMPER_FORCE = 650
 LAUNCH_FORCE = 720
+BUMPER_REACH = BUMPER_RADIUS + BALL_RADIUS
+BUMPER_REACH_SQ = BUMPER_REACH * BUMPER_REACH
+FLIPPER_REACH = BALL_RADIUS + FLIPPER_WIDTH / 2
+FLIPPER_REACH_SQ = FLIPPER_REACH * FLIPPER_REACH
+
+# Flipper keys, bound once so the input poll avoids module attribute lookups.
+_K_LEFT, _K_A, _K_RIGHT, _K_D = pygame.K_LEFT, pygame.K_a, pygame.K_RIGHT, pygame.K_d
 
 
 Color = Tuple[int, int, int]
@@ -41,102 +52,183 @@ YELLOW: Color = (255, 210, 90)
 RED: Color = (230, 80, 80)
 SHADOW: Color = (0, 0, 0)
 
-
-@dataclass
+# Drop-shadow offsets; ball and bumper shadows are baked into their cached sprites.
+BALL_SHADOW_OFFSET = (3, 5)
+BUMPER_SHADOW_OFFSET = (4, 6)
+FLIPPER_SHADOW_OFFSET = (3, 3)
+
+
+def _circle_sprite(color: Color, radius: int, shadow_radius: int, shadow_offset: Tuple[int, int]) -> pygame.Surface:
+    """Pre-render a drop-shadowed circle centred at (shadow_radius, shadow_radius).
+
+    Sprites are converted to the display's pixel format, so the display mode must
+    already be set; matching formats let SDL blit without per-pixel conversion.
+    """
+    size = (2 * shadow_radius + shadow_offset[0], 2 * shadow_radius + shadow_offset[1])
+    sprite = pygame.Surface(size, pygame.SRCALPHA).convert_alpha()
+    centre = (shadow_radius, shadow_radius)
+    pygame.draw.circle(sprite, SHADOW, (centre[0] + shadow_offset[0], centre[1] + shadow_offset[1]), shadow_radius)
+    pygame.draw.circle(sprite, color, centre, radius)
+    return sprite
+
+
+def _collide_bumpers(
+    px: float,
+    py: float,
+    vx: float,
+    vy: float,
+    bx: Sequence[float],
+    by: Sequence[float],
+    values: Sequence[int],
+) -> tuple[float, float, float, float, int]:
+    """Bounce the ball off the first bumper it overlaps.
+
+    ``bx``/``by``/``values`` are parallel columns sorted by y. Bumpers sit further
+    apart than the ball's diameter, so at most one can be hit at a time. Returns
+    the new ball position and velocity together with the score earned.
+    """
+    for x, y, value in zip(bx, by, values):
+        dy = py - y
+        if dy < -BUMPER_REACH:
+            break
+        if dy > BUMPER_REACH:
+            continue
+        dx = px - x
+        d2 = dx * dx + dy * dy
+        if d2 > BUMPER_REACH_SQ:
+            continue
+        distance = math.sqrt(d2)
+        nx = dx / distance
+        ny = dy / distance
+        dot2 = 2 * (vx * nx + vy * ny)
+        vx = vx - dot2 * nx + nx * BUMPER_FORCE * 0.4
+        vy = vy - dot2 * ny + ny * BUMPER_FORCE * 0.4
+        px = x + nx * (BUMPER_REACH + 2)
+        py = y + ny * (BUMPER_REACH + 2)
+        return px, py, vx, vy, value
+    return px, py, vx, vy, 0
+
+
+@dataclass(slots=True)
 class Flipper:
     pivot: pygame.math.Vector2
     is_left: bool
     color: Color
     angle: float = FLIPPER_REST_ANGLE
     activated: bool = False
+    cap: pygame.Surface = field(init=False, repr=False)
+    _tip_x: float = field(init=False, repr=False)
+    _tip_y: float = field(init=False, repr=False)
+    _dir_x: float = field(init=False, repr=False)
+    _dir_y: float = field(init=False, repr=False)
+    _cap_pos: tuple[float, float] = field(init=False, repr=False)
+    _shadow_pivot: tuple[float, float] = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self.cap = pygame.Surface((FLIPPER_WIDTH, FLIPPER_WIDTH), pygame.SRCALPHA).convert_alpha()
+        pygame.draw.circle(self.cap, self.color, (FLIPPER_WIDTH // 2, FLIPPER_WIDTH // 2), FLIPPER_WIDTH // 2)
+        # The pivot never moves, so everything drawn relative to it is resolved once.
+        self._cap_pos = (self.pivot.x - FLIPPER_WIDTH // 2, self.pivot.y - FLIPPER_WIDTH // 2)
+        self._shadow_pivot = (self.pivot.x + FLIPPER_SHADOW_OFFSET[0], self.pivot.y + FLIPPER_SHADOW_OFFSET[1])
+        self._update_tip()
 
     def update(self, dt: float) -> None:
         target_angle = FLIPPER_ANGLE if self.activated else FLIPPER_REST_ANGLE
-        direction = 1 if target_angle > self.angle else -1
-        if math.isclose(self.angle, target_angle, abs_tol=1e-3):
-            self.angle = target_angle
+        if self.angle == target_angle:
             return
-        self.angle += direction * FLIPPER_SPEED * dt
-        if (direction > 0 and self.angle > target_angle) or (direction < 0 and self.angle < target_angle):
+        delta = target_angle - self.angle
+        step = FLIPPER_SPEED * dt
+        if abs(delta) <= step:
             self.angle = target_angle
+        else:
+            self.angle += math.copysign(step, delta)
+        self._update_tip()
 
-    def toggle(self, active: bool) -> None:
-        self.activated = active
+    def _update_tip(self) -> None:
+        # The tip only moves with the angle, so the trig is done once per angle change
+        # and shared by collide() and draw(). The direction is unit length by construction.
+        self._dir_x = math.cos(self.angle)
+        self._dir_y = math.sin(self.angle) * (1 if self.is_left else -1)
+        self._tip_x = self.pivot.x + self._dir_x * FLIPPER_LENGTH
+        self._tip_y = self.pivot.y + self._dir_y * FLIPPER_LENGTH
 
-    def get_tip(self) -> pygame.math.Vector2:
-        direction = pygame.math.Vector2(math.cos(self.angle), math.sin(self.angle))
-        if not self.is_left:
-            direction.y *= -1
-        return self.pivot + direction * FLIPPER_LENGTH
+    def get_tip(self) -> tuple[float, float]:
+        return self._tip_x, self._tip_y
 
     def collide(self, ball: "Ball") -> bool:
+        pivot_x, pivot_y = self.pivot
+        dir_x = self._dir_x
+        dir_y = self._dir_y
+        rel_x = ball.px - pivot_x
+        rel_y = ball.py - pivot_y
+        projection_length = max(0, min(FLIPPER_LENGTH, rel_x * dir_x + rel_y * dir_y))
+        dx = rel_x - dir_x * projection_length
+        dy = rel_y - dir_y * projection_length
+        d2 = dx * dx + dy * dy
+        if d2 > FLIPPER_REACH_SQ:
+            return False
+        distance = math.sqrt(d2)
+        nx = dx / distance
+        ny = dy / distance
+        dot = ball.vx * nx + ball.vy * ny
+        if dot >= 0:
+            # Already moving away; sub-stepping keeps penetration shallow, so the
+            # ball separates on its own without being pushed out.
+            return False
+        ball.vx = ball.vx - 2 * dot * nx + nx * 120
+        ball.vy = ball.vy - 2 * dot * ny + ny * 120 - (60 if self.is_left else 0)
+        return True
+
+    def draw(self, surface: pygame.Surface) -> pygame.Rect:
         tip = self.get_tip()
-        nearest = ball.position - self.pivot
-        direction = (tip - self.pivot).normalize()
-        projection_length = max(0, min(FLIPPER_LENGTH, nearest.dot(direction)))
-        closest_point = self.pivot + direction * projection_length
-        if (ball.position - closest_point).length() <= BALL_RADIUS + FLIPPER_WIDTH / 2:
-            normal = (ball.position - closest_point).normalize()
-            ball.velocity = ball.velocity.reflect(normal) + normal * 120
-            ball.position += normal * 4
-            ball.velocity.y -= 60 if self.is_left else 0
-            return True
-        return False
-
-    def draw(self, surface: pygame.Surface) -> None:
-        tip = self.get_tip()
-        pygame.draw.line(surface, SHADOW, self.pivot + pygame.math.Vector2(3, 3), tip + pygame.math.Vector2(3, 3), FLIPPER_WIDTH)
-        pygame.draw.line(surface, self.color, self.pivot, tip, FLIPPER_WIDTH)
-        pygame.draw.circle(surface, self.color, self.pivot, FLIPPER_WIDTH // 2)
+        shadow_tip = (tip[0] + FLIPPER_SHADOW_OFFSET[0], tip[1] + FLIPPER_SHADOW_OFFSET[1])
+        shadow = pygame.draw.line(surface, SHADOW, self._shadow_pivot, shadow_tip, FLIPPER_WIDTH)
+        return shadow.union(pygame.draw.line(surface, self.color, self.pivot, tip, FLIPPER_WIDTH))
+
+    def sprite_blit(self) -> tuple[pygame.Surface, tuple[float, float]]:
+        return self.cap, self._cap_pos
 
 
-@dataclass
+@dataclass(slots=True)
 class Bumper:
-    position: pygame.math.Vector2
+    pos_x: float
+    pos_y: float
     color: Color = BLUE
     value: int = 100
+    sprite: pygame.Surface = field(init=False, repr=False)
 
-    def collide(self, ball: "Ball") -> bool:
-        displacement = ball.position - self.position
-        distance = displacement.length()
-        if distance <= BUMPER_RADIUS + BALL_RADIUS:
-            normal = displacement.normalize()
-            impulse = normal * BUMPER_FORCE
-            ball.velocity = ball.velocity.reflect(normal) + impulse * 0.4
-            ball.position = self.position + normal * (BUMPER_RADIUS + BALL_RADIUS + 2)
-            return True
-        return False
-
-    def draw(self, surface: pygame.Surface) -> None:
-        pygame.draw.circle(surface, SHADOW, self.position + pygame.math.Vector2(4, 6), BUMPER_RADIUS + 3)
-        pygame.draw.circle(surface, self.color, self.position, BUMPER_RADIUS)
-        pygame.draw.circle(surface, WHITE, self.position, 8)
-
-
-@dataclass
+    def __post_init__(self) -> None:
+        self.sprite = _circle_sprite(self.color, BUMPER_RADIUS, BUMPER_RADIUS + 3, BUMPER_SHADOW_OFFSET)
+        pygame.draw.circle(self.sprite, WHITE, (BUMPER_RADIUS + 3, BUMPER_RADIUS + 3), 8)
+
+    def sprite_blit(self) -> tuple[pygame.Surface, tuple[float, float]]:
+        return self.sprite, (self.pos_x - BUMPER_RADIUS - 3, self.pos_y - BUMPER_RADIUS - 3)
+
+
+@dataclass(slots=True)
 class Ball:
-    position: pygame.math.Vector2
-    velocity: pygame.math.Vector2
+    px: float
+    py: float
+    vx: float
+    vy: float
 
     def update(self, dt: float) -> None:
-        self.velocity.y += GRAVITY * dt
-        self.position += self.velocity * dt
+        vy = self.vy + GRAVITY * dt
+        self.vy = vy
+        self.px += self.vx * dt
+        self.py += vy * dt
         self._handle_walls()
 
     def _handle_walls(self) -> None:
-        if self.position.x - BALL_RADIUS < 20:
-            self.position.x = 20 + BALL_RADIUS
-            self.velocity.x = abs(self.velocity.x) * 0.92
-        if self.position.x + BALL_RADIUS > WIDTH - 20:
-            self.position.x = WIDTH - 20 - BALL_RADIUS
-            self.velocity.x = -abs(self.velocity.x) * 0.92
-        if self.position.y - BALL_RADIUS < 20:
-            self.position.y = 20 + BALL_RADIUS
-            self.velocity.y = abs(self.velocity.y) * 0.92
-
-    def draw(self, surface: pygame.Surface) -> None:
-        pygame.draw.circle(surface, SHADOW, self.position + pygame.math.Vector2(3, 5), BALL_RADIUS)
-        pygame.draw.circle(surface, YELLOW, self.position, BALL_RADIUS)
+        if self.px - BALL_RADIUS < 20:
+            self.px = 20 + BALL_RADIUS
+            self.vx = abs(self.vx) * 0.92
+        if self.px + BALL_RADIUS > WIDTH - 20:
+            self.px = WIDTH - 20 - BALL_RADIUS
+            self.vx = -abs(self.vx) * 0.92
+        if self.py - BALL_RADIUS < 20:
+            self.py = 20 + BALL_RADIUS
+            self.vy = abs(self.vy) * 0.92
 
 
 class Game:
@@ -144,81 +236,133 @@ class Game:
         pygame.init()
         self.screen = pygame.display.set_mode((WIDTH, HEIGHT))
         pygame.display.set_caption("Pinball Arcade")
-        self.clock = pygame.time.Clock()
+        # Only quitting, key presses and window exposure are handled as events; flippers
+        # read the key state. Expose/restore events trigger a full repaint of the window.
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed(
+            [pygame.QUIT, pygame.KEYDOWN, pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED, pygame.WINDOWRESTORED]
+        )
         self.font = pygame.font.SysFont("consolas", 24)
 
         self.left_flipper = Flipper(pivot=pygame.math.Vector2(270, 820), is_left=True, color=GREEN)
         self.right_flipper = Flipper(pivot=pygame.math.Vector2(530, 820), is_left=False, color=GREEN)
-        self.bumpers = self._create_bumpers()
+        # Bumpers are kept column-wise, sorted top to bottom so collision checks can
+        # stop once past the ball's row.
+        bumpers = sorted(self._create_bumpers(), key=lambda bumper: bumper.pos_y)
+        self._bx = tuple(bumper.pos_x for bumper in bumpers)
+        self._by = tuple(bumper.pos_y for bumper in bumpers)
+        self._bvalue = tuple(bumper.value for bumper in bumpers)
+        # Every ball looks the same, so one sprite is shared by all launches.
+        self._ball_sprite = _circle_sprite(YELLOW, BALL_RADIUS, BALL_RADIUS, BALL_SHADOW_OFFSET)
         self.ball: Ball | None = None
         self.score = 0
 
+        # Static HUD text is rasterised once; the score is re-rendered only when it changes.
+        # Text keeps its alpha channel because it is antialiased over the wall edge.
+        self._info_surf = self.font.render("Space to launch, Arrow/A-D to flip", True, WHITE).convert_alpha()
+        self._prompt_surf = self.font.render("Press SPACE to launch a ball", True, WHITE).convert_alpha()
+        self._prompt_pos = (WIDTH // 2 - self._prompt_surf.get_width() // 2, HEIGHT - 70)
+        self._last_score = -1
+        self._score_surf: pygame.Surface | None = None
+
+        # Walls and bumpers never change, so they are rendered once and only the areas
+        # touched by moving objects are pushed to the display each frame.
+        self._background = self._render_background([bumper.sprite_blit() for bumper in bumpers])
+        self._prev_dirty = [self.screen.get_rect()]
+
     def _create_bumpers(self) -> list[Bumper]:
         bumpers = []
         for y in (260, 360, 460):
             for x in (220, 320, 480, 580):
-                bumpers.append(Bumper(position=pygame.math.Vector2(x, y), color=random.choice([BLUE, RED]), value=150))
-        bumpers.append(Bumper(position=pygame.math.Vector2(WIDTH // 2, 560), color=BLUE, value=250))
+                bumpers.append(Bumper(pos_x=x, pos_y=y, color=random.choice([BLUE, RED]), value=150))
+        bumpers.append(Bumper(pos_x=WIDTH // 2, pos_y=560, color=BLUE, value=250))
         return bumpers
 
     def launch_ball(self) -> None:
-        spawn = pygame.math.Vector2(WIDTH - 70, HEIGHT - 80)
-        velocity = pygame.math.Vector2(random.uniform(-120, 120), -LAUNCH_FORCE)
-        self.ball = Ball(position=spawn, velocity=velocity)
+        self.ball = Ball(px=WIDTH - 70, py=HEIGHT - 80, vx=random.uniform(-120, 120), vy=-LAUNCH_FORCE)
 
-    def update(self, dt: float) -> None:
+    def read_input(self) -> None:
         keys = pygame.key.get_pressed()
-        self.left_flipper.toggle(keys[pygame.K_LEFT] or keys[pygame.K_a])
-        self.right_flipper.toggle(keys[pygame.K_RIGHT] or keys[pygame.K_d])
+        self.left_flipper.activated = keys[_K_LEFT] or keys[_K_A]
+        self.right_flipper.activated = keys[_K_RIGHT] or keys[_K_D]
 
+    def update(self, dt: float) -> None:
         self.left_flipper.update(dt)
         self.right_flipper.update(dt)
 
-        if self.ball:
-            self.ball.update(dt)
-            self._handle_collisions()
-            if self.ball.position.y - BALL_RADIUS > HEIGHT + 40:
-                self.ball = None
-
-    def _handle_collisions(self) -> None:
-        if not self.ball:
+        ball = self.ball
+        if ball is None:
             return
-        for flipper in (self.left_flipper, self.right_flipper):
-            flipper.collide(self.ball)
-        for bumper in self.bumpers:
-            if bumper.collide(self.ball):
-                self.score += bumper.value
+        ball_update = ball.update
+        handle_collisions = self._handle_collisions
+        sub_dt = dt / PHYS_SUBSTEPS
+        for _ in range(PHYS_SUBSTEPS):
+            ball_update(sub_dt)
+            handle_collisions(ball)
+        if ball.py - BALL_RADIUS > HEIGHT + 40:
+            self.ball = None
+
+    def _handle_collisions(self, ball: Ball) -> None:
+        self.left_flipper.collide(ball)
+        self.right_flipper.collide(ball)
+        ball.px, ball.py, ball.vx, ball.vy, score = _collide_bumpers(
+            ball.px, ball.py, ball.vx, ball.vy, self._bx, self._by, self._bvalue
+        )
+        self.score += score
+
+    def _render_background(self, bumper_blits: list[tuple[pygame.Surface, tuple[float, float]]]) -> pygame.Surface:
+        # Fully opaque, so a plain convert() gives the fastest blit path.
+        background = pygame.Surface((WIDTH, HEIGHT)).convert()
+        background.fill(DARK)
+        self._draw_walls(background)
+        background.blits(bumper_blits, doreturn=False)
+        return background
 
     def draw(self) -> None:
-        self.screen.fill(DARK)
-        self._draw_walls()
-        for bumper in self.bumpers:
-            bumper.draw(self.screen)
-        self.left_flipper.draw(self.screen)
-        self.right_flipper.draw(self.screen)
-        if self.ball:
-            self.ball.draw(self.screen)
-        self._draw_hud()
-        pygame.display.flip()
-
-    def _draw_walls(self) -> None:
-        pygame.draw.rect(self.screen, (50, 60, 70), pygame.Rect(10, 10, WIDTH - 20, HEIGHT - 20), 16)
-        pygame.draw.rect(self.screen, (90, 100, 120), pygame.Rect(WIDTH - 120, HEIGHT - 170, 90, 160))
-        pygame.draw.circle(self.screen, (70, 80, 95), (WIDTH - 75, HEIGHT - 190), 50, 8)
-
-    def _draw_hud(self) -> None:
-        score_text = self.font.render(f"Score: {self.score}", True, WHITE)
-        info_text = self.font.render("Space to launch, Arrow/A-D to flip", True, WHITE)
-        self.screen.blit(score_text, (24, 24))
-        self.screen.blit(info_text, (24, 54))
+        # Everything drawn last frame lies inside its dirty rects, so restoring just those
+        # from the background leaves a clean board without repainting the whole window.
+        screen = self.screen
+        blits = screen.blits
+        background = self._background
+        prev_dirty = self._prev_dirty
+        left_flipper = self.left_flipper
+        right_flipper = self.right_flipper
+        blits([(background, rect, rect) for rect in prev_dirty], doreturn=False)
+        dirty = [left_flipper.draw(screen), right_flipper.draw(screen)]
+        sprites = [left_flipper.sprite_blit(), right_flipper.sprite_blit()]
+        ball = self.ball
+        if ball:
+            sprites.append((self._ball_sprite, (ball.px - BALL_RADIUS, ball.py - BALL_RADIUS)))
+        dirty += blits(sprites)
+        dirty += self._draw_hud()
+        # Last frame's rects are included so whatever moved away from them is cleared too.
+        pygame.display.update(prev_dirty + dirty)
+        self._prev_dirty = dirty
+
+    def _draw_walls(self, surface: pygame.Surface) -> None:
+        pygame.draw.rect(surface, (50, 60, 70), pygame.Rect(10, 10, WIDTH - 20, HEIGHT - 20), 16)
+        pygame.draw.rect(surface, (90, 100, 120), pygame.Rect(WIDTH - 120, HEIGHT - 170, 90, 160))
+        pygame.draw.circle(surface, (70, 80, 95), (WIDTH - 75, HEIGHT - 190), 50, 8)
+
+    def _draw_hud(self) -> list[pygame.Rect]:
+        if self.score != self._last_score:
+            self._score_surf = self.font.render(f"Score: {self.score}", True, WHITE).convert_alpha()
+            self._last_score = self.score
+        hud = [(self._score_surf, (24, 24)), (self._info_surf, (24, 54))]
         if not self.ball:
-            prompt = self.font.render("Press SPACE to launch a ball", True, WHITE)
-            self.screen.blit(prompt, (WIDTH // 2 - prompt.get_width() // 2, HEIGHT - 70))
+            hud.append((self._prompt_surf, self._prompt_pos))
+        return self.screen.blits(hud)
 
     def run(self) -> None:
         running = True
+        accumulator = 0.0
+        frame_time = 1 / FPS
+        last = next_frame = time.perf_counter()
         while running:
-            dt = self.clock.tick(FPS) / 1000.0
+            now = time.perf_counter()
+            accumulator += min(now - last, MAX_FRAME_TIME)
+            last = now
+            next_frame += frame_time
             for event in pygame.event.get():
                 if event.type == pygame.QUIT:
                     running = False
@@ -227,10 +371,24 @@ class Game:
                         running = False
                     if event.key == pygame.K_SPACE and not self.ball:
                         self.launch_ball()
-
-            self.update(dt)
+                elif event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED, pygame.WINDOWRESTORED):
+                    # SDL does not repaint an exposed window, so restore and present all of it.
+                    self._prev_dirty = [self.screen.get_rect()]
+
+            self.read_input()
+            while accumulator >= PHYS_DT:
+                self.update(PHYS_DT)
+                accumulator -= PHYS_DT
             self.draw()
 
+            # Sleep only when ahead of schedule; a late frame restarts the schedule
+            # instead of rushing the following frames to catch up.
+            sleep_for = next_frame - time.perf_counter()
+            if sleep_for > 0:
+                time.sleep(sleep_for)
+            else:
+                next_frame = time.perf_counter()
+
         pygame.quit()
 
 